@@ -1,6 +1,7 @@
 import argparse
 import logging
 import sys
+from functools import cache
 from pathlib import Path
 
 from docco.config import load_config, load_project_config
@@ -11,7 +12,9 @@ from docco.pipeline import PipelineError, build_pipeline, discover_stages, run_p
 log = logging.getLogger("docco.cli")
 
 
-def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+@cache
+def _parser() -> argparse.ArgumentParser:
+    # Built once per process; parse_args() leaves the parser unchanged
     parser = argparse.ArgumentParser(
         prog="docco", description="Markdown to PDF converter"
     )
@@ -27,7 +30,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "--config", type=Path, default=None, help="Path to project docco.toml"
     )
-    return parser.parse_args(argv)
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    return _parser().parse_args(argv)
 
 
 def _resolve_input_files(cli_inputs: list[Path], project_config: dict) -> list[Path]:
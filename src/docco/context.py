@@ -19,7 +19,7 @@ class Phase(StrEnum):
     POSTPROCESS = "postprocess"
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
     source_path: Path
     output_dir: Path
@@ -41,6 +41,7 @@ class Context:
         output_dir: Path,
         config: dict[str, Any],
         config_dir: Path | None = None,
+        content_type: ContentType = ContentType.MARKDOWN,
     ) -> Context:
         content = source_path.read_text(encoding="utf-8")
         return cls(
@@ -48,7 +49,7 @@ class Context:
             output_dir=output_dir,
             config=config,
             content=content,
-            content_type=ContentType.MARKDOWN,
+            content_type=content_type,
             config_dir=config_dir or source_path.parent,
         )
 
@@ -60,12 +61,6 @@ class Context:
         config: dict[str, Any],
         config_dir: Path | None = None,
     ) -> Context:
-        content = source_path.read_text(encoding="utf-8")
-        return cls(
-            source_path=source_path,
-            output_dir=output_dir,
-            config=config,
-            content=content,
-            content_type=ContentType.HTML,
-            config_dir=config_dir or source_path.parent,
+        return cls.from_file(
+            source_path, output_dir, config, config_dir, ContentType.HTML
         )
@@ -2,6 +2,8 @@ import logging
 import re
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import lru_cache
 from importlib.metadata import entry_points
 from pathlib import Path
 
@@ -14,6 +16,42 @@ _COMMENT_RE_CACHE: dict[
 ] = {}  # name -> compiled <!-- name ... --> pattern
 
 
+def _directive_pattern(name: str) -> re.Pattern:
+    pattern = _COMMENT_RE_CACHE.get(name)
+    if pattern is None:
+        pattern = re.compile(rf"<!--\s*{re.escape(name)}(.*?)-->", re.DOTALL)
+        _COMMENT_RE_CACHE[name] = pattern
+    return pattern
+
+
+@lru_cache(maxsize=512)
+def _parse_attrs(raw: str) -> tuple[tuple[str, str], ...] | None:
+    # Directives repeat verbatim (e.g. every page break), so the tokenizing is
+    # cached on the raw attribute string. None means unparseable content remains.
+    kv_attrs = dict(_ATTR_RE.findall(raw))
+    cleaned = _ATTR_RE.sub("", raw).strip()
+    flag_attrs = {f: "true" for f in _FLAG_RE.findall(cleaned)}
+    if _FLAG_RE.sub("", cleaned).strip():
+        return None
+    return tuple({**flag_attrs, **kv_attrs}.items())
+
+
+def _directive_attrs(
+    name: str, m: re.Match, allowed: frozenset[str] | None
+) -> dict[str, str]:
+    parsed = _parse_attrs(m.group(1).strip())
+    if parsed is None:
+        raise ValueError(f"Malformed {name!r} directive: {m.group(0)!r}")
+    attrs = dict(parsed)
+    if allowed is not None:
+        unknown = sorted(set(attrs) - allowed)
+        if unknown:
+            raise ValueError(
+                f"Unknown arg(s) {unknown!r} in {name!r} directive: {m.group(0)!r}"
+            )
+    return attrs
+
+
 class PipelineError(RuntimeError):
     def __init__(self, message: str, contexts: list[Context]) -> None:
         super().__init__(message)
@@ -82,28 +120,29 @@ class Stage(ABC):
         Raises ValueError for any directive that contains unparseable content.
         If ``allowed`` is not None, raises ValueError for any unknown arg/flag names.
         """
-        pattern = _COMMENT_RE_CACHE.get(name)
-        if pattern is None:
-            pattern = re.compile(rf"<!--\s*{re.escape(name)}(.*?)-->", re.DOTALL)
-            _COMMENT_RE_CACHE[name] = pattern
-        results = []
-        for m in pattern.finditer(content):
-            raw = m.group(1).strip()
-            kv_attrs = dict(_ATTR_RE.findall(raw))
-            cleaned = _ATTR_RE.sub("", raw).strip()
-            flag_attrs = {f: "true" for f in _FLAG_RE.findall(cleaned)}
-            remainder = _FLAG_RE.sub("", cleaned).strip()
-            if remainder:
-                raise ValueError(f"Malformed {name!r} directive: {m.group(0)!r}")
-            attrs = {**flag_attrs, **kv_attrs}
-            if allowed is not None:
-                unknown = sorted(set(attrs) - allowed)
-                if unknown:
-                    raise ValueError(
-                        f"Unknown arg(s) {unknown!r} in {name!r} directive: {m.group(0)!r}"
-                    )
-            results.append((m.group(0), attrs))
-        return results
+        if name not in content:
+            return []  # cheap substring test; the regex cannot match without it
+        return [
+            (m.group(0), _directive_attrs(name, m, allowed))
+            for m in _directive_pattern(name).finditer(content)
+        ]
+
+    @staticmethod
+    def sub_directives(
+        name: str,
+        content: str,
+        repl: Callable[[str, dict[str, str]], str],
+        allowed: frozenset[str] | None = None,
+    ) -> str:
+        """Replace every <!-- name ... --> directive with repl(full_match, attrs_dict).
+
+        Single pass over content; attrs are parsed and validated as in parse_directives.
+        """
+        if name not in content:
+            return content
+        return _directive_pattern(name).sub(
+            lambda m: repl(m.group(0), _directive_attrs(name, m, allowed)), content
+        )
 
     def get_directives(
         self,
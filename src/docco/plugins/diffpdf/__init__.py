@@ -1,5 +1,3 @@
-import diffpdf as diffpdf_lib
-
 from docco.context import ContentType, Context, Phase
 from docco.pipeline import Stage as BaseStage
 from docco.utils import tmp_file
@@ -37,6 +35,8 @@ class Stage(BaseStage):
                 if f.name.startswith(stem + "_"):
                     f.unlink()
 
+        import diffpdf as diffpdf_lib
+
         with tmp_file(".pdf", context.content) as tmp_path:
             identical = diffpdf_lib.diffpdf(
                 existing_path,
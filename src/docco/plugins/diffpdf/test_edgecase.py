@@ -14,7 +14,7 @@ def test_disabled_by_default(tmp_path):
 
 
 def test_no_existing_file(tmp_path):
-    with patch("docco.plugins.diffpdf.diffpdf_lib.diffpdf") as mock_diff:
+    with patch("diffpdf.diffpdf") as mock_diff:
         result = Stage().process(
             make_ctx(
                 tmp_path, b"%PDF-new", {"diffpdf": {"enable": True}}, ContentType.PDF
@@ -30,7 +30,7 @@ def test_differs_keeps_new(tmp_path):
     )
     ctx.output_dir.mkdir(parents=True, exist_ok=True)
     (ctx.output_dir / "test.pdf").write_bytes(b"%PDF-old")
-    with patch("docco.plugins.diffpdf.diffpdf_lib.diffpdf", return_value=False):
+    with patch("diffpdf.diffpdf", return_value=False):
         result = Stage().process(ctx)
     assert "skipped" not in result.artifacts
     assert result.content == b"%PDF-new"
@@ -53,7 +53,7 @@ def test_delete_diff_images(tmp_path):
     # belongs to a different doc → must be preserved
     other = diff_dir / "other_vs_tmp_page1_diff.png"
     other.write_bytes(b"other")
-    with patch("docco.plugins.diffpdf.diffpdf_lib.diffpdf", return_value=False):
+    with patch("diffpdf.diffpdf", return_value=False):
         Stage().process(ctx)
     assert not stale.exists()
     assert other.exists()
@@ -72,6 +72,6 @@ def test_delete_diff_images_disabled(tmp_path):
     diff_dir.mkdir()
     stale = diff_dir / "test_vs_tmp_page1_diff.png"
     stale.write_bytes(b"stale")
-    with patch("docco.plugins.diffpdf.diffpdf_lib.diffpdf", return_value=False):
+    with patch("diffpdf.diffpdf", return_value=False):
         Stage().process(ctx)
     assert stale.exists()
@@ -1,4 +1,6 @@
 import re
+from functools import cache
+from html import escape
 from pathlib import Path
 from urllib.parse import urljoin
 
@@ -11,18 +13,27 @@ from docco.pipeline import Stage as BaseStage
 
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 DEFAULT_TEMPLATE = TEMPLATE_DIR / "base.html"
+_DEFAULT_TEMPLATE_HTML = DEFAULT_TEMPLATE.read_text(encoding="utf-8")
 
+# Everything _render_template fills in, matched in one pass over the template only
+_TEMPLATE_SLOT_RE = re.compile(r"\{\{ (?:body|css) \}\}|</?head>")
+_CSS_CACHE: dict[tuple[str, int], str] = {}  # (path, mtime_ns) -> absolutized CSS
+_CSS_URL_RE = re.compile(r'url\(["\']?([^)]+?)["\']?\)')
+# URLs that are already absolute and must be left untouched
+ABSOLUTE_URL_PREFIXES = ("http://", "https://", "file://", "data:")
 
-def _absolutize_css_urls(css: str, css_path: Path) -> str:
-    base_url = css_path.resolve().parent.as_uri()
+
+def absolutize_css_urls(css: str, css_path: Path) -> str:
+    """Rewrite relative url(...) references in css to file:// URLs next to css_path."""
+    base_url = css_path.resolve().parent.as_uri() + "/"
 
     def replace_url(m: re.Match) -> str:
         url = m.group(1).strip("'\" ")
-        if any(url.startswith(p) for p in ("http://", "https://", "file://", "data:")):
+        if url.startswith(ABSOLUTE_URL_PREFIXES):
             return m.group(0)
-        return f'url("{urljoin(base_url + "/", url)}")'
+        return f'url("{urljoin(base_url, url)}")'
 
-    return re.sub(r'url\(["\']?([^)]+?)["\']?\)', replace_url, css)
+    return _CSS_URL_RE.sub(replace_url, css)
 
 
 def _to_path_list(value: str | list[str] | None) -> list[str]:
@@ -31,6 +42,15 @@ def _to_path_list(value: str | list[str] | None) -> list[str]:
     return [value] if isinstance(value, str) else list(value)
 
 
+def _read_css(css_path: Path) -> str:
+    key = (str(css_path), css_path.stat().st_mtime_ns)
+    css = _CSS_CACHE.get(key)
+    if css is None:
+        css = absolutize_css_urls(css_path.read_text(encoding="utf-8"), css_path)
+        _CSS_CACHE[key] = css
+    return css
+
+
 def _collect_css(html_config: dict) -> str:
     parts: list[str] = []
     for css_path_str in html_config.get("css", []):
@@ -38,8 +58,7 @@ def _collect_css(html_config: dict) -> str:
         if not css_path.is_file():
             msg = f"CSS file not found: {css_path}"
             raise FileNotFoundError(msg)
-        raw_css = css_path.read_text(encoding="utf-8")
-        parts.append(_absolutize_css_urls(raw_css, css_path))
+        parts.append(_read_css(css_path))
         log.debug("Loaded CSS: %s", css_path)
     return "\n".join(parts)
 
@@ -61,7 +80,7 @@ def _load_template(html_config: dict) -> str:
     paths = html_config.get("template", [])
     if paths:
         return Path(paths[-1]).read_text(encoding="utf-8")
-    return DEFAULT_TEMPLATE.read_text(encoding="utf-8")
+    return _DEFAULT_TEMPLATE_HTML
 
 
 def _render_template(
@@ -72,13 +91,35 @@ def _render_template(
     js_external: list[str],
     title: str,
 ) -> str:
-    script_tags = "".join(f"<script>\n{js}\n</script>\n" for js in js_inline)
-    script_tags += "".join(f'<script src="{url}"></script>\n' for url in js_external)
-    result = template.replace("{{ body }}", body).replace("{{ css }}", css)
-    result = result.replace("<head>", f"<head>\n    <title>{title}</title>", 1)
-    if script_tags:
-        result = result.replace("</head>", f"{script_tags}</head>", 1)
-    return result
+    tags = [f"<script>\n{js}\n</script>\n" for js in js_inline]
+    tags.extend(f'<script src="{url}"></script>\n' for url in js_external)
+    slots = {
+        "{{ body }}": body,
+        "{{ css }}": css,
+        "<head>": f"<head>\n    <title>{escape(title)}</title>",
+        "</head>": f"{''.join(tags)}</head>",
+    }
+
+    def fill(m: re.Match) -> str:
+        key = m.group(0)
+        if key[0] == "<":
+            return slots.pop(key, key)  # only the first <head>/</head> is extended
+        return slots[key]
+
+    return _TEMPLATE_SLOT_RE.sub(fill, template)
+
+
+@cache
+def _markdown_parser() -> MarkdownIt:
+    # Shared across Stage instances: the pipeline is rebuilt per input file,
+    # and render() keeps no state on the parser between calls.
+    return (
+        MarkdownIt("commonmark", {"html": True})
+        .use(anchors_plugin, min_level=1, max_level=6, permalink=False)
+        .use(attrs_plugin)
+        .use(attrs_block_plugin)
+        .enable("table")
+    )
 
 
 class Stage(BaseStage):
@@ -107,13 +148,7 @@ class Stage(BaseStage):
         return result
 
     def __init__(self) -> None:
-        self._md = (
-            MarkdownIt("commonmark", {"html": True})
-            .use(anchors_plugin, min_level=1, max_level=6, permalink=False)
-            .use(attrs_plugin)
-            .use(attrs_block_plugin)
-            .enable("table")
-        )
+        self._md = _markdown_parser()
 
     def process(self, context: Context) -> Context:
         assert isinstance(context.content, str)
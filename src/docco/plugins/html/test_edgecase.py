@@ -46,6 +46,21 @@ def test_custom_template(tmp_path):
     assert "<p>Hello</p>" in result.str_content
 
 
+def test_template_placeholders_in_body_kept(tmp_path):
+    css = tmp_path / "style.css"
+    css.write_text("p { color: red; }", encoding="utf-8")
+    cfg = {"html": {"css": [str(css)]}}
+    result = Stage().process(make_ctx(tmp_path, "Write `{{ css }}`", cfg))
+    assert "<code>{{ css }}</code>" in result.str_content
+
+
 def test_normalize_config_template(tmp_path):
     result = Stage.normalize_config_section({"template": "tpl.html"}, tmp_path)
     assert result["template"] == [str((tmp_path / "tpl.html").resolve())]
+
+
+def test_title_escaped(tmp_path):
+    result = Stage().process(
+        make_ctx(tmp_path, "Hello", {"html": {"title": "R&D <1>"}})
+    )
+    assert "<title>R&amp;D &lt;1&gt;</title>" in result.str_content
@@ -9,6 +9,8 @@ MAX_ITERATIONS = 10
 _DIRECTIVE_RE = re.compile(r'<!--\s*inline\s+src="([^"]+)"(.*?)-->')
 _PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
 _INLINE_PATH_RE = re.compile(r'(<!--\s*inline\s+src=")([^"]+)(")')
+# (path, mtime_ns) -> fragment split on placeholders: text at even, names at odd
+_FRAGMENT_CACHE: dict[tuple[str, int], list[str]] = {}
 
 
 def _rebase_inline_paths(content: str, file_dir: Path) -> str:
@@ -21,31 +23,35 @@ def _rebase_inline_paths(content: str, file_dir: Path) -> str:
     return _INLINE_PATH_RE.sub(rewrite, content)
 
 
-def _has_directives(content: str) -> bool:
-    return bool(_DIRECTIVE_RE.search(content))
+def _read_fragment(path: Path) -> list[str]:
+    key = (str(path), path.stat().st_mtime_ns)
+    parts = _FRAGMENT_CACHE.get(key)
+    if parts is None:
+        content = path.read_text(encoding="utf-8")
+        if path.suffix == ".html":
+            content = "\n".join(line.strip() for line in content.splitlines())
+        parts = _PLACEHOLDER_RE.split(_rebase_inline_paths(content, path.parent))
+        _FRAGMENT_CACHE[key] = parts
+    return parts
 
 
-def _process_one_pass(content: str, base_dir: Path) -> str:
+def _process_one_pass(content: str, base_dir: Path) -> tuple[str, int]:
     def replace_directive(m: re.Match) -> str:
         filepath_str = m.group(1)
-        args_str = m.group(2).strip()
-        args = dict(_ATTR_RE.findall(args_str))
+        args = dict(_ATTR_RE.findall(m.group(2)))
 
         full_path = (base_dir / filepath_str).resolve()
-        if not full_path.exists():
+        try:
+            parts = _read_fragment(full_path)
+        except FileNotFoundError:
             msg = f"Inline file not found: {filepath_str}"
-            raise FileNotFoundError(msg)
+            raise FileNotFoundError(msg) from None
 
-        file_content = full_path.read_text(encoding="utf-8")
-        if full_path.suffix == ".html":
-            file_content = "\n".join(line.strip() for line in file_content.splitlines())
-        file_content = _rebase_inline_paths(file_content, full_path.parent)
-
-        placeholders = set(_PLACEHOLDER_RE.findall(file_content))
-        for key, value in args.items():
-            placeholder = f"{{{{{key}}}}}"
-            if placeholder in file_content:
-                file_content = file_content.replace(placeholder, value)
+        names = parts[1::2]
+        placeholders = set(names)
+        filled = parts.copy()
+        filled[1::2] = [args.get(name, f"{{{{{name}}}}}") for name in names]
+        file_content = "".join(filled)
 
         unused = set(args) - placeholders
         unfulfilled = placeholders - set(args)
@@ -62,7 +68,7 @@ def _process_one_pass(content: str, base_dir: Path) -> str:
 
         return file_content
 
-    return _DIRECTIVE_RE.sub(replace_directive, content)
+    return _DIRECTIVE_RE.subn(replace_directive, content)
 
 
 class Stage(BaseStage):
@@ -77,14 +83,17 @@ class Stage(BaseStage):
         base_dir = context.source_path.parent
         self.parse_directives("inline", context.content, allowed=None)
         iteration = 0
-        while _has_directives(context.content) and iteration < MAX_ITERATIONS:
+        # Repeat until a pass replaces nothing; subn's count saves a search per pass
+        while True:
+            content, count = _process_one_pass(context.content, base_dir)
+            if not count:
+                break
+            if iteration >= MAX_ITERATIONS:
+                msg = f"Max iterations ({MAX_ITERATIONS}) exceeded in inline processing"
+                raise ValueError(msg)
             iteration += 1
             self.log.debug("Inline processing iteration %d", iteration)
-            context.content = _process_one_pass(context.content, base_dir)
-
-        if iteration >= MAX_ITERATIONS and _has_directives(context.content):
-            msg = f"Max iterations ({MAX_ITERATIONS}) exceeded in inline processing"
-            raise ValueError(msg)
+            context.content = content
 
         if iteration:
             self.log.info("Inlined files in %d pass(es)", iteration)
@@ -33,41 +33,37 @@ def _orientation(attrs: dict) -> str | None:
 
 
 def _process_body(body: str, directives: list[tuple[str, dict[str, str]]]) -> str:
-    # First pass: replace pagebreaks
-    for full_match, attrs in directives:
-        if attrs.get(Arg.BREAK) == "true":
-            body = body.replace(full_match, '<div class="pagebreak"></div>', 1)
-
-    # Collect orientation directives present in body (after pagebreak replacements)
-    orientation_directives = [
-        (full_match, attrs)
-        for full_match, attrs in directives
-        if _orientation(attrs) is not None and full_match in body
-    ]
-
-    if not orientation_directives:
-        return body
-
+    # Directives are parsed from this body, in order, so each one is searched for
+    # from the end of the previous one: the body is walked once, left to right.
     sections: list[tuple[str, str]] = []
-    current_pos = 0
+    parts: list[str] = []
     current_orientation = "portrait"
+    pos = 0
 
-    for full_match, attrs in orientation_directives:
-        idx = body.find(full_match)
-        sections.append((current_orientation, body[current_pos:idx].strip()))
-        current_orientation = _orientation(attrs) or current_orientation
-        current_pos = idx + len(full_match)
+    for full_match, attrs in directives:
+        is_break = attrs.get(Arg.BREAK) == "true"
+        orientation = None if is_break else _orientation(attrs)
+        if not is_break and orientation is None:
+            continue
+        idx = body.find(full_match, pos)
+        parts.append(body[pos:idx])
+        pos = idx + len(full_match)
+        if orientation is None:
+            parts.append('<div class="pagebreak"></div>')
+        else:
+            sections.append((current_orientation, "".join(parts).strip()))
+            parts = []
+            current_orientation = orientation
 
-    sections.append((current_orientation, body[current_pos:].strip()))
+    parts.append(body[pos:])
+    if not sections:
+        return "".join(parts)
 
-    result = "\n".join(
+    sections.append((current_orientation, "".join(parts).strip()))
+    return "\n".join(
         f'<div class="section-wrapper {orientation}">\n{content}\n</div>'
         for orientation, content in sections
     )
-    # Remove any leftover orientation directive matches
-    for full_match, attrs in orientation_directives:
-        result = result.replace(full_match, "")
-    return result
 
 
 class Stage(BaseStage):
@@ -80,26 +76,26 @@ class Stage(BaseStage):
 
     def process(self, context: Context) -> Context:
         assert isinstance(context.content, str)
-        directives = self.get_directives(context.content, frozenset(Arg))
-        has_directives = bool(directives)
-
-        def replace_body(m: re.Match) -> str:
-            return (
-                m.group(1)
-                + "\n"
-                + _process_body(m.group(2), directives)
-                + "\n"
-                + m.group(3)
-            )
-
-        context.content = _BODY_RE.sub(replace_body, context.content)
+        # split() yields [outside, <body>, body, </body>, outside, ...]. Each piece
+        # is parsed once: bodies for layout, the rest to validate and detect only.
+        pieces = _BODY_RE.split(context.content)
+        has_directives = False
+        for i, piece in enumerate(pieces):
+            if i % 4 in (1, 3):
+                continue
+            directives = self.get_directives(piece, frozenset(Arg))
+            has_directives = has_directives or bool(directives)
+            if i % 4 == 2:
+                pieces[i] = f"\n{_process_body(piece, directives)}\n"
+        context.content = "".join(pieces)
         page_config = self.get_config(context)
-        inject = f"<style>\n{_PAGE_CSS}</style>\n"
+        inject = ["<style>\n", _PAGE_CSS, "</style>\n"]
         if has_directives:
-            inject += f"<script>\n{_LANDSCAPE_HANDLER_JS}</script>\n"
+            inject += ["<script>\n", _LANDSCAPE_HANDLER_JS, "</script>\n"]
         if page_config.get("add_pagedjs_screen_css", True):
-            inject += f"<style>\n{_PAGEDJS_SCREEN_CSS}</style>\n"
-        context.content = context.content.replace("</head>", f"{inject}</head>", 1)
+            inject += ["<style>\n", _PAGEDJS_SCREEN_CSS, "</style>\n"]
+        inject.append("</head>")
+        context.content = context.content.replace("</head>", "".join(inject), 1)
         if has_directives:
             self.log.info("Processed page layout directives")
         else:
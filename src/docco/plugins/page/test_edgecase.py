@@ -15,3 +15,42 @@ def test_pagedjs_screen_css_disabled(tmp_path):
     )
     result = Stage().process(ctx)
     assert "pagedjs_page" not in result.str_content
+
+
+def test_repeated_orientation_directives(tmp_path):
+    body = (
+        "a<!-- page landscape -->b<!-- page portrait -->"
+        "c<!-- page landscape -->d<!-- page -->"
+    )
+    ctx = make_ctx(
+        tmp_path,
+        f"<html><head><!-- page break --></head><body>{body}</body></html>",
+        content_type=ContentType.HTML,
+    )
+    result = Stage().process(ctx).str_content
+    assert result.count('<div class="section-wrapper landscape">\n') == 2
+    assert "<head><!-- page break -->" in result
+    assert "<!-- page -->" in result
+
+
+def test_head_directive_does_not_skip_body_directives(tmp_path):
+    ctx = make_ctx(
+        tmp_path,
+        "<head><!-- page landscape --></head>"
+        "<body>a<!-- page break -->b<!-- page landscape -->c</body>",
+        content_type=ContentType.HTML,
+    )
+    result = Stage().process(ctx).str_content
+    assert '<div class="pagebreak"></div>' in result
+    assert "<!-- page break -->" not in result
+
+
+def test_head_only_directive_injects_handler(tmp_path):
+    ctx = make_ctx(
+        tmp_path,
+        "<html><head><!-- page landscape --></head><body>a</body></html>",
+        content_type=ContentType.HTML,
+    )
+    result = Stage().process(ctx).str_content
+    assert "landscape_page" in result
+    assert "<body>\na\n</body>" in result
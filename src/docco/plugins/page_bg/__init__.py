@@ -33,10 +33,10 @@ class Stage(BaseStage):
 
     def process(self, context: Context) -> Context:
         assert isinstance(context.content, str)
-        content = context.content
         counter = 0
 
-        for full_match, attrs in self.get_directives(content, frozenset(Arg)):
+        def replace(full_match: str, attrs: dict[str, str]) -> str:
+            nonlocal counter
             image = attrs.get(Arg.IMAGE)
             if not image:
                 raise ValueError(
@@ -49,10 +49,12 @@ class Stage(BaseStage):
                 size=attrs.get(Arg.SIZE, "contain"),
                 counter=counter,
             )
-            content = content.replace(full_match, result, 1)
             counter += 1
+            return result
 
-        context.content = content
+        context.content = self.sub_directives(
+            self.name, context.content, replace, frozenset(Arg)
+        )
         if counter:
             self.log.info("Processed %d page-bg directive(s)", counter)
         else:
@@ -63,9 +63,12 @@ class Stage(BaseStage):
         skip_if_exists: bool = cfg.get("skip_if_exists", True)
 
         doc_dir = context.source_path.parent
-        content = context.content
+        svg_dir = doc_dir / svg_dir_name
 
-        for full_match, attrs in self.get_directives(content, frozenset(Arg)):
+        # Validate every directive before writing anything, so a bad directive
+        # late in the document fails without leaving earlier SVGs on disk
+        plans: dict[str, tuple[Path, int, Path, str]] = {}
+        for full_match, attrs in self.get_directives(context.content, frozenset(Arg)):
             src_str = attrs.get(Arg.SRC)
             page_str = attrs.get(Arg.PAGE)
             if not src_str:
@@ -86,20 +89,22 @@ class Stage(BaseStage):
                 raise FileNotFoundError(f"PDF not found: {pdf_path}")
             if pdf_path.suffix.lower() != ".pdf":
                 raise ValueError(f"Source file is not a PDF: {pdf_path}")
+            replacement = "" if quiet else f"{svg_dir_name}/{out_name}"
+            plans[full_match] = (pdf_path, page_num, svg_dir / out_name, replacement)
 
-            svg_dir = doc_dir / svg_dir_name
-            svg_path = svg_dir / out_name
-
+        content = context.content
+        extracted: set[Path] = set()
+        for full_match, (pdf_path, page_num, svg_path, replacement) in plans.items():
             if skip_if_exists and svg_path.exists():
                 log.debug("SVG already exists, skipping: %s", svg_path)
-            else:
+            elif svg_path not in extracted:
                 svg_dir.mkdir(parents=True, exist_ok=True)
                 svg_content = _extract_svg(pdf_path, page_num)
                 svg_path.write_text(svg_content, encoding="utf-8")
+                extracted.add(svg_path)
                 log.info("Written SVG: %s", svg_path)
-
-            replacement = "" if quiet else f"{svg_dir_name}/{out_name}"
-            content = content.replace(full_match, replacement, 1)
+            # Identical directives share one plan, so replace every occurrence
+            content = content.replace(full_match, replacement)
 
         context.content = content
         return context
@@ -71,3 +71,14 @@ def test_non_pdf_source(tmp_path):
     ctx = make_ctx(tmp_path, '<!-- pdf2svg src="doc.txt" page="1" -->')
     with pytest.raises(ValueError, match="not a PDF"):
         Stage().process(ctx)
+
+
+def test_invalid_directive_writes_nothing(tmp_path):
+    pdf = _make_pdf(tmp_path)
+    ctx = make_ctx(
+        tmp_path,
+        f'<!-- pdf2svg src="{pdf.name}" page="1" -->\n<!-- pdf2svg page="1" -->',
+    )
+    with pytest.raises(ValueError, match="Missing 'src'"):
+        Stage().process(ctx)
+    assert not (tmp_path / "assets").exists()
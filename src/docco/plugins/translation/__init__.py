@@ -6,7 +6,6 @@ from io import BytesIO
 from pathlib import Path
 
 import polib
-from translate.convert import html2po, po2html
 
 from docco.context import ContentType, Context, Phase
 from docco.pipeline import Stage as BaseStage
@@ -16,15 +15,22 @@ _FILTER_RE = re.compile(
     r"<!--\s*filter\s*:\s*(\S+)\s*-->(.*?)<!--\s*/filter\s*-->",
     re.DOTALL,
 )
+_ID_ATTR_RE = re.compile(r'\s+id="[^"]*"')
 
 
 def _apply_filter(content: str, language: str) -> str:
+    if "/filter" not in content:
+        return content  # cheap substring test; no block can close without it
     lang = language.lower()
-
-    def replace_block(m: re.Match) -> str:
-        return m.group(2) if m.group(1).strip().lower() == lang else ""
-
-    return _FILTER_RE.sub(replace_block, content)
+    parts: list[str] = []
+    pos = 0
+    for m in _FILTER_RE.finditer(content):
+        parts.append(content[pos : m.start()])
+        if m.group(1).strip().lower() == lang:
+            parts.append(m.group(2))
+        pos = m.end()
+    parts.append(content[pos:])
+    return "".join(parts)
 
 
 def _clean_po(po_path: Path) -> None:
@@ -37,7 +43,9 @@ def _clean_po(po_path: Path) -> None:
 
 
 def _extract_pot(html: str, pot_path: Path, source_name: str) -> None:
-    stripped = re.sub(r'\s+id="[^"]*"', "", html).encode("utf-8")
+    from translate.convert import html2po
+
+    stripped = _ID_ATTR_RE.sub("", html).encode("utf-8")
     buf = BytesIO(stripped)
     buf.name = source_name
     with pot_path.open("wb") as f:
@@ -98,6 +106,7 @@ def _update_po(pot_path: Path, po_path: Path) -> None:
             ["pot2po", "-t", po_path, "-i", pot_path, "-o", tmp],
             capture_output=True,
             text=True,
+            encoding="utf-8",
             timeout=30,
             check=False,
         )
@@ -128,24 +137,30 @@ def _check_sync(pot_path: Path, po_path: Path) -> bool:
 
 
 def _po_stats(po_path: Path) -> dict[str, int]:
-    units = [u for u in _parsefile(po_path).units if u.istranslatable()]
-    translated = sum(1 for u in units if u.istranslated() and not u.isfuzzy())
-    fuzzy = sum(1 for u in units if u.isfuzzy())
-    untranslated = sum(1 for u in units if not u.istranslated() and not u.isfuzzy())
-    return {
-        "total": len(units),
-        "translated": translated,
-        "fuzzy": fuzzy,
-        "untranslated": untranslated,
-    }
+    stats = {"total": 0, "translated": 0, "fuzzy": 0, "untranslated": 0}
+    for unit in _parsefile(po_path).units:
+        if not unit.istranslatable():
+            continue
+        stats["total"] += 1
+        if unit.isfuzzy():
+            stats["fuzzy"] += 1
+        elif unit.istranslated():
+            stats["translated"] += 1
+        else:
+            stats["untranslated"] += 1
+    return stats
 
 
 def _apply_po(html: str, po_path: Path) -> str:
-    with tmp_file(".html", html) as tmp_html_path:
-        out = BytesIO()
-        with po_path.open("rb") as pf, tmp_html_path.open("rb") as hf:
-            po2html.converthtml(pf, out, hf)
-        return out.getvalue().decode("utf-8")
+    from translate.convert import po2html
+
+    # The HTML template is handed over in memory, as in _extract_pot
+    template = BytesIO(html.encode("utf-8"))
+    template.name = po_path.with_suffix(".html").name
+    out = BytesIO()
+    with po_path.open("rb") as pf:
+        po2html.converthtml(pf, out, template)
+    return out.getvalue().decode("utf-8")
 
 
 def _resolve_paths(raw: str | list, base_dir: Path) -> list[Path]:
@@ -368,7 +383,7 @@ class Stage(BaseStage):
                 "PO out of sync for '%s' -- document has changed, updating",
                 langcode.upper(),
             )
-        _update_po(pot_path, doc_po)
+            _update_po(pot_path, doc_po)
 
         all_po = [*terms, *extra_po, doc_po]
         if len(all_po) == 1:
@@ -119,6 +119,10 @@ def test_filter_unknown_config_key_raises():
         FilterStage().validate_config({"translation": {"bogus": True}})
 
 
+def test_filter_per_language_po_key_accepted():
+    FilterStage().validate_config({"translation": {"po_de": "extra.po"}})
+
+
 def test_stage_passthrough_no_langcode(tmp_path):
     assert Stage().process(_ctx(tmp_path)).content == HTML
 
@@ -1,7 +1,5 @@
 import io
 
-import paramiko
-
 from docco.context import ContentType, Context, Phase
 from docco.pipeline import Stage as BaseStage
 
@@ -39,6 +37,8 @@ class Stage(BaseStage):
         filename = context.source_path.stem + ".pdf"
         remote_path = f"{remote_dir}/{filename}"
 
+        import paramiko
+
         with paramiko.SSHClient() as ssh:
             ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             ssh.connect(host, port=port, username=cfg["user"], password=cfg["password"])
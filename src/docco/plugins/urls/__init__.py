@@ -7,64 +7,69 @@ from urllib.request import url2pathname
 
 from docco.context import ContentType, Context, Phase
 from docco.pipeline import Stage as BaseStage
+from docco.plugins.html import ABSOLUTE_URL_PREFIXES, absolutize_css_urls
 
+# URLs that are already absolute (or in-page) and must be left untouched
+_HTML_ABSOLUTE_PREFIXES = ("#", *ABSOLUTE_URL_PREFIXES)
 
-def _absolutize_css_urls(css: str, css_path: Path) -> str:
-    base_url = css_path.resolve().parent.as_uri()
-
-    def replace_url(m: re.Match) -> str:
-        url = m.group(1).strip("'\" ")
-        if any(url.startswith(p) for p in ("http://", "https://", "file://", "data:")):
-            return m.group(0)
-        return f'url("{urljoin(base_url + "/", url)}")'
-
-    return re.sub(r'url\(["\']?([^)]+?)["\']?\)', replace_url, css)
+_STYLE_RE = re.compile(r"<style>(.*?)</style>", re.DOTALL)
+_CSS_FILE_URL_RE = re.compile(r'url\("(file://[^"]+)"\)')
+_HTML_URL_RE = re.compile(r'((?:src|href))=(["\'])(.*?)\2')
+# One scan for every URL to check: src/href attributes or CSS url() references
+_LINK_URL_RE = re.compile(
+    r'(?:src|href)=["\']?((?:file|https?)://[^"\'>\s]+)'
+    r'|url\(["\']?((?:file|https?)://[^"\')\s]+)["\']?\)'
+)
 
 
 def _fix_style_block_urls(html: str, base_dir: Path) -> str:
     sentinel = base_dir / "_"
+    checked: set[str] = set()  # file URLs already stat()ed in an earlier block
 
     def replace_style(m: re.Match) -> str:
-        absolutized = _absolutize_css_urls(m.group(1), sentinel)
-        for url_match in re.finditer(r'url\("(file://[^"]+)"\)', absolutized):
-            file_path = Path(url2pathname(url_match.group(1)[7:]))
+        absolutized = absolutize_css_urls(m.group(1), sentinel)
+        for url_match in _CSS_FILE_URL_RE.finditer(absolutized):
+            url = url_match.group(1)
+            if url in checked:
+                continue
+            file_path = Path(url2pathname(url[7:]))
             if not file_path.exists():
                 msg = f"Asset not found (referenced in CSS): {file_path}"
                 raise FileNotFoundError(msg)
+            checked.add(url)
         return f"<style>{absolutized}</style>"
 
-    return re.sub(r"<style>(.*?)</style>", replace_style, html, flags=re.DOTALL)
+    return _STYLE_RE.sub(replace_style, html)
 
 
 def _absolutize_html_urls(html: str, base_dir: Path) -> str:
-    base_url = base_dir.resolve().as_uri()
+    base_url = base_dir.resolve().as_uri() + "/"
 
     def replace_url(m: re.Match) -> str:
         attr, quote, url = m.group(1), m.group(2), m.group(3)
-        if any(
-            url.startswith(p) for p in ("#", "http://", "https://", "file://", "data:")
-        ):
+        if url.startswith(_HTML_ABSOLUTE_PREFIXES):
             return m.group(0)
-        return f"{attr}={quote}{urljoin(base_url + '/', url)}{quote}"
-
-    return re.sub(r'((?:src|href))=(["\'])(.*?)\2', replace_url, html)
-
+        return f"{attr}={quote}{urljoin(base_url, url)}{quote}"
 
-def _extract_file_urls(html: str) -> list[str]:
-    attr_urls = re.findall(r'(?:src|href)=["\']?(file://[^"\'>\s]+)', html)
-    css_urls = re.findall(r'url\(["\']?(file://[^"\')\s]+)["\']?\)', html)
-    return attr_urls + css_urls
+    return _HTML_URL_RE.sub(replace_url, html)
 
 
-def _extract_http_urls(html: str) -> list[str]:
-    attr_urls = re.findall(r'(?:src|href)=["\']?(https?://[^"\'>\s]+)', html)
-    css_urls = re.findall(r'url\(["\']?(https?://[^"\')\s]+)["\']?\)', html)
-    return attr_urls + css_urls
+def _extract_urls(html: str) -> tuple[list[str], list[str]]:
+    """Return (file_urls, http_urls) from src/href attributes and CSS url()."""
+    file_urls: list[str] = []
+    http_urls: list[str] = []
+    for attr_url, css_url in _LINK_URL_RE.findall(html):
+        url = attr_url or css_url
+        (file_urls if url.startswith("file://") else http_urls).append(url)
+    return file_urls, http_urls
 
 
 def _check_urls(html: str, base_dir: Path, *, local_only: bool = True) -> None:
-    file_urls = _extract_file_urls(html)
-    http_urls = [] if local_only else _extract_http_urls(html)
+    # Deduplicate (keeping document order): a logo or icon repeated on every
+    # page only needs one stat() or HEAD request.
+    file_urls, http_urls = _extract_urls(html)
+    file_urls = list(dict.fromkeys(file_urls))
+    http_urls = [] if local_only else list(dict.fromkeys(http_urls))
     if file_urls or http_urls:
         log.info("Checking %d URL(s)...", len(file_urls) + len(http_urls))
 
@@ -33,6 +33,13 @@ def test_urls_absolutizes_style_block(tmp_path):
     assert "bg.png" in result.str_content
 
 
+def test_urls_style_blocks_share_asset(tmp_path):
+    (tmp_path / "bg.png").write_bytes(b"PNG")
+    block = "<style>body { background: url('bg.png'); }</style>"
+    result = Stage().process(make_ctx(tmp_path, block * 2, content_type=HTML))
+    assert result.str_content.count("file://") == 2
+
+
 def test_urls_style_block_missing_asset(tmp_path):
     with pytest.raises(FileNotFoundError, match="Asset not found"):
         Stage().process(
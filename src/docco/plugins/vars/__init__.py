@@ -6,11 +6,24 @@ from docco.pipeline import Stage as BaseStage
 
 RESERVED_VARS = {"PATH", "DAY", "MONTH", "YEAR"}
 
+_VAR_RE = re.compile(r"\$\$(\w+)\$\$")
 
-def _apply_variables(content: str, variables: dict[str, str]) -> str:
-    for name, value in variables.items():
-        content = content.replace(f"$${name}$$", value)
-    return content
+
+def _apply_variables(
+    content: str, variables: dict[str, str], pattern: re.Pattern[str]
+) -> str:
+    def lookup(m: re.Match) -> str:
+        return variables[m.group(0)[2:-2]]
+
+    # Repeat so values may reference other variables. An acyclic chain resolves
+    # within one pass per variable, so anything left after that is a cycle.
+    for _ in range(len(variables) + 1):
+        content, count = pattern.subn(lookup, content)
+        if not count:
+            return content
+    cyclic = sorted({match[2:-2] for match in pattern.findall(content)})
+    msg = f"Cyclic variable reference involving: {', '.join(cyclic)}"
+    raise ValueError(msg)
 
 
 class Stage(BaseStage):
@@ -43,9 +56,12 @@ class Stage(BaseStage):
 
         user_vars = set(variables) - RESERVED_VARS
         original = context.content
-        context.content = _apply_variables(original, variables)
+        var_pattern = re.compile(
+            "|".join(re.escape(f"$${name}$$") for name in variables)
+        )
+        context.content = _apply_variables(original, variables, var_pattern)
 
-        undefined = re.findall(r"\$\$(\w+)\$\$", context.content)
+        undefined = _VAR_RE.findall(context.content)
         if undefined:
             msg = f"Undefined variables: {', '.join(undefined)}"
             raise ValueError(msg)
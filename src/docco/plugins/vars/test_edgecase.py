@@ -33,3 +33,34 @@ def test_unused_var_warning(tmp_path, caplog):
     )
     Stage().process(ctx)
     assert "unused" in caplog.text.lower()
+
+
+def test_chained_vars_expand(tmp_path):
+    ctx = make_ctx(
+        tmp_path,
+        "<p>$$a$$</p>",
+        config={"vars": {"a": "$$b$$", "b": "x"}},
+        content_type=ContentType.HTML,
+    )
+    assert Stage().process(ctx).str_content == "<p>x</p>"
+
+
+def test_cyclic_vars_raise(tmp_path):
+    ctx = make_ctx(
+        tmp_path,
+        "<p>$$a$$</p>",
+        config={"vars": {"a": "$$b$$", "b": "$$a$$"}},
+        content_type=ContentType.HTML,
+    )
+    with pytest.raises(ValueError, match="Cyclic variable reference"):
+        Stage().process(ctx)
+
+
+def test_hyphenated_var_name(tmp_path):
+    ctx = make_ctx(
+        tmp_path,
+        "<p>$$my-var$$</p>",
+        config={"vars": {"my-var": "X"}},
+        content_type=ContentType.HTML,
+    )
+    assert Stage().process(ctx).str_content == "<p>X</p>"
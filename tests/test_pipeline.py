@@ -60,8 +60,45 @@ def test_parse_directives_allowed_unknown_raises():
 
 
 def test_parse_directives_caches_pattern():
-    Stage.parse_directives("cached_name", "no match")
-    Stage.parse_directives("cached_name", "no match again")
+    Stage.parse_directives("cached_name", "cached_name, no match")
+    Stage.parse_directives("cached_name", "cached_name, no match again")
+
+
+def test_parse_directives_repeated_attrs_are_independent():
+    (_, first), (_, second) = Stage.parse_directives(
+        "foo", '<!-- foo a="1" --><!-- foo a="1" -->'
+    )
+    first["a"] = "changed"
+    assert second == {"a": "1"}
+
+
+# --- sub_directives ---
+
+
+def test_sub_directives_replaces_with_attrs():
+    result = Stage.sub_directives(
+        "foo",
+        '<!-- foo a="1" quiet --> and <!-- foo a="2" -->',
+        lambda _, attrs: ",".join(f"{k}={v}" for k, v in sorted(attrs.items())),
+    )
+    assert result == "a=1,quiet=true and a=2"
+
+
+def test_sub_directives_absent_name_unchanged():
+    content = '<!-- bar a="1" -->'
+    assert Stage.sub_directives("foo", content, lambda *_: "x") is content
+
+
+def test_sub_directives_malformed_raises():
+    with pytest.raises(ValueError, match="Malformed 'foo' directive"):
+        Stage.sub_directives("foo", "<!-- foo = -->", lambda *_: "")
+
+
+def test_sub_directives_allowed_unknown_raises():
+    with pytest.raises(ValueError, match="Unknown arg"):
+        Stage.sub_directives(
+            "foo", '<!-- foo bad="x" -->', lambda *_: "", frozenset({"key"})
+        )
 
 
 # --- Stage ABC ---